@@ -1,18 +1,48 @@
 import os
+import re
 import sys
 import json
 import time
 import boto3
+import botocore.config
 import math
+import tempfile
 import subprocess
 import validation_bar
+import concurrent.futures
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 import create_testing_resources.kinesis_s3_firehose.resource_resolver as resource_resolver
 
+# Task polling backs off from INITIAL_WAITER_SLEEP up to WAITER_SLEEP, and gives up
+# after the time MAX_WAITER_ATTEMPTS polls at WAITER_SLEEP would have taken
+INITIAL_WAITER_SLEEP = 5
+WAITER_BACKOFF_MULTIPLIER = 1.5
 WAITER_SLEEP = 30
 MAX_WAITER_ATTEMPTS = 240
 MAX_WAITER_DESCRIBE_FAILURES = 2
+# Poll stack creation and node status more often than the defaults (30s and 90s),
+# covering a longer window for stack creation
+STACK_CREATE_WAITER_CONFIG = {'Delay': 10, 'MaxAttempts': 180}
+EKS_NODES_WAITER_SLEEP = 15
+# EKS tests wait up to 10 mins run + buffer for setup/log delivery, returning early
+# only once no log stream has ingested new events for the whole quiet period
+EKS_LOG_DELIVERY_TIMEOUT_IN_SECOND = 1000
+EKS_LOG_DELIVERY_QUIET_PERIOD_IN_SECOND = 180
+EKS_LOG_STREAM_WAITER_SLEEP = 30
+VALIDATOR_BINARY_PATH = '/tmp/validate'
+MAX_VALIDATOR_WORKERS = 8
+VALIDATOR_TIMEOUT_IN_SECOND = 3600
+MAX_S3_DELETE_WORKERS = 16
 IS_TASK_DEFINITION_PRINTED = True
+# Shared by every client: a connection pool large enough for the concurrent calls made
+# from thread pools, with adaptive retries against throttling
+BOTO_CLIENT_CONFIG = botocore.config.Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
 PLATFORM = os.environ['PLATFORM'].lower()
 OUTPUT_PLUGIN = os.environ['OUTPUT_PLUGIN'].lower()
 LOG_GROUP_NAME = os.environ.get('CW_LOG_GROUP_NAME', "unavailable")
@@ -61,7 +91,8 @@ def __sleep(duration, reason):
 # Return the approximate log delay for each ecs load test
 # Estimate log delay = task_stop_time - task_start_time - logger_image_run_time
 def get_log_delay(log_delay_epoch_time):
-    return datetime.fromtimestamp(log_delay_epoch_time).strftime('%Mm%Ss')
+    minutes, seconds = divmod(int(log_delay_epoch_time), 60)
+    return f"{minutes}m{seconds}s"
 
 # Set buffer for waiting all logs sent to destinations (~5min)
 def set_buffer(stop_epoch_time):
@@ -77,8 +108,8 @@ def parse_time(time):
 
 # Check app container exit status for each ecs load test
 # to make sure it generate correct number of logs
-def check_app_exit_code(response):
-    containers = response['tasks'][0]['containers']
+def check_app_exit_code(task):
+    containers = task['containers']
     if len(containers) < 2:
         sys.exit('[TEST_FAILURE] Error occured to get task container list')
     for container in containers:
@@ -91,12 +122,24 @@ def calculate_total_input_number(throughput):
     iteration_per_second = int(throughput[0:-1])*1000
     return str(iteration_per_second * LOGGER_RUN_TIME_IN_SECOND)
 
+# Templates are identical across throughputs, so read each file only once
+@lru_cache(maxsize=None)
+def read_template(path):
+    with open(path, 'r') as fin:
+        return fin.read()
+
+# Input configurations are requested with the same arguments for task definitions
+# and validation, so resolve them once. The cached value is shared, hence read-only
+@lru_cache(maxsize=256)
+def get_input_configuration(input_prefix, throughput):
+    return MappingProxyType(resource_resolver.get_input_configuration(PLATFORM, input_prefix, throughput))
+
 # 1. Configure task definition for each load test based on existing templates
 # 2. Register generated task definition
-def generate_task_definition(throughput, input_logger, s3_fluent_config_arn):
+def generate_task_definition(ecs_client, throughput, input_logger, s3_fluent_config_arn, is_printed):
     # Generate configuration information for STD and TCP tests
-    std_config      = resource_resolver.get_input_configuration(PLATFORM, resource_resolver.STD_INPUT_PREFIX, throughput)
-    custom_config   = resource_resolver.get_input_configuration(PLATFORM, resource_resolver.CUSTOM_INPUT_PREFIX, throughput)
+    std_config      = get_input_configuration(resource_resolver.STD_INPUT_PREFIX, throughput)
+    custom_config   = get_input_configuration(resource_resolver.CUSTOM_INPUT_PREFIX, throughput)
 
     task_definition_dict = {
 
@@ -120,48 +163,39 @@ def generate_task_definition(throughput, input_logger, s3_fluent_config_arn):
         '$CUSTOM_S3_OBJECT_NAME':           resource_resolver.resolve_s3_object_name(custom_config),
 
         # Plugin Specific Environment Variables
-        'cloudwatch': {
-            '$CW_LOG_GROUP_NAME':               LOG_GROUP_NAME,
-            '$STD_LOG_STREAM_NAME':             resource_resolver.resolve_cloudwatch_logs_stream_name(std_config),
-            '$CUSTOM_LOG_STREAM_NAME':          resource_resolver.resolve_cloudwatch_logs_stream_name(custom_config)
-        },
-        'firehose': {
-            '$STD_DELIVERY_STREAM_PREFIX':      resource_resolver.resolve_firehose_delivery_stream_name(std_config),
-            '$CUSTOM_DELIVERY_STREAM_PREFIX':   resource_resolver.resolve_firehose_delivery_stream_name(custom_config),
-        },
-        'kinesis': {
-            '$STD_STREAM_PREFIX':               resource_resolver.resolve_kinesis_delivery_stream_name(std_config),
-            '$CUSTOM_STREAM_PREFIX':            resource_resolver.resolve_kinesis_delivery_stream_name(custom_config),
-        },
-        's3': {
-            '$S3_BUCKET_NAME':                  S3_BUCKET_NAME,
-            '$STD_S3_OBJECT_NAME':              resource_resolver.resolve_s3_object_name(std_config),
-        },
+        # Task definition templates and the tcp logger config reference the variables
+        # of every plugin, so all of them are resolved regardless of OUTPUT_PLUGIN
+        '$CW_LOG_GROUP_NAME':               LOG_GROUP_NAME,
+        '$STD_LOG_STREAM_NAME':             resource_resolver.resolve_cloudwatch_logs_stream_name(std_config),
+        '$CUSTOM_LOG_STREAM_NAME':          resource_resolver.resolve_cloudwatch_logs_stream_name(custom_config),
+        '$STD_DELIVERY_STREAM_PREFIX':      resource_resolver.resolve_firehose_delivery_stream_name(std_config),
+        '$CUSTOM_DELIVERY_STREAM_PREFIX':   resource_resolver.resolve_firehose_delivery_stream_name(custom_config),
+        '$STD_STREAM_PREFIX':               resource_resolver.resolve_kinesis_delivery_stream_name(std_config),
+        '$CUSTOM_STREAM_PREFIX':            resource_resolver.resolve_kinesis_delivery_stream_name(custom_config),
+        '$S3_BUCKET_NAME':                  S3_BUCKET_NAME,
+        '$STD_S3_OBJECT_NAME':              resource_resolver.resolve_s3_object_name(std_config),
     }
 
     # Add log configuration to dictionary
-    log_configuration_data = open(f'{input_logger["log_configuration_path"]}/{OUTPUT_PLUGIN}.json', 'r')
-    log_configuration_raw = log_configuration_data.read()
+    log_configuration_raw = read_template(f'{input_logger["log_configuration_path"]}/{OUTPUT_PLUGIN}.json')
     log_configuration = parse_json_template(log_configuration_raw, task_definition_dict)
     task_definition_dict["$LOG_CONFIGURATION"] = log_configuration
 
     # Parse task definition template
-    fin = open(f'./load_tests/task_definitions/{OUTPUT_PLUGIN}.json', 'r')
-    data = fin.read()
+    data = read_template(f'./load_tests/task_definitions/{OUTPUT_PLUGIN}.json')
     task_def_formatted = parse_json_template(data, task_definition_dict)
 
     # Register task definition
     task_def = json.loads(task_def_formatted)
 
-    if IS_TASK_DEFINITION_PRINTED:
+    if is_printed:
         print("Registering task definition:", flush=True)
-        print(json.dumps(task_def, indent=4), flush=True)
-        client = boto3.client('ecs')
-        client.register_task_definition(
-            **task_def
-        )
+        print(json.dumps(task_def, separators=(',', ':')), flush=True)
     else:
-        print("Registering task definition", flush=True)
+        print(f"Registering task definition for {throughput}", flush=True)
+    ecs_client.register_task_definition(
+        **task_def
+    )
 
 # With multiple codebuild projects running parallel,
 # Testing resources only needs to be created once
@@ -169,7 +203,7 @@ def create_testing_resources():
     session = get_sts_boto_session()
 
     if OUTPUT_PLUGIN != 'cloudwatch':
-        client = session.client('cloudformation')
+        client = session.client('cloudformation', config=BOTO_CLIENT_CONFIG)
         waiter = client.get_waiter('stack_exists')
         waiter.wait(
             StackName=TESTING_RESOURCES_STACK_NAME,
@@ -179,59 +213,81 @@ def create_testing_resources():
         )
         waiter = client.get_waiter('stack_create_complete')
         waiter.wait(
-            StackName=TESTING_RESOURCES_STACK_NAME
+            StackName=TESTING_RESOURCES_STACK_NAME,
+            WaiterConfig=STACK_CREATE_WAITER_CONFIG
         )
     else:
         # scale up eks cluster
         if PLATFORM == 'eks':
-            os.system(f'eksctl scale nodegroup --cluster={EKS_CLUSTER_NAME} --nodes={NUM_OF_EKS_NODES} ng')
+            subprocess.run(['eksctl', 'scale', 'nodegroup', f'--cluster={EKS_CLUSTER_NAME}', f'--nodes={NUM_OF_EKS_NODES}', 'ng'], check=True)
             while True:
-                __sleep(90, "Waiting for EKS cluster nodes")
-                number_of_nodes = subprocess.getoutput("kubectl get nodes --no-headers=true | wc -l")
-                if(int(number_of_nodes) == NUM_OF_EKS_NODES):
+                __sleep(EKS_NODES_WAITER_SLEEP, "Waiting for EKS cluster nodes")
+                number_of_nodes = len(subprocess.check_output(['kubectl', 'get', 'nodes', '--no-headers=true']).splitlines())
+                if(number_of_nodes == NUM_OF_EKS_NODES):
                     break
             # create namespace
-            os.system('kubectl apply -f ./load_tests/create_testing_resources/eks/namespace.yaml')
+            subprocess.run(['kubectl', 'apply', '-f', './load_tests/create_testing_resources/eks/namespace.yaml'], check=True)
         # Once deployment starts, it will wait until the stack creation is completed
         os.chdir(f'./load_tests/{sys.argv[1]}/{PLATFORM}')
-        os.system('cdk deploy --require-approval never')
+        subprocess.run(['cdk', 'deploy', '--require-approval', 'never'], check=True)
 
-# this function will log the state of the task at each iteration
+# Poll all tasks with a single describe_tasks call per iteration
+# (the API accepts up to 100 task arns) until every task has stopped.
+# This function will log the state of the tasks at each iteration
 # to help debug
-def wait_ecs_tasks(ecs_cluster_name, task_arn):
-    running = True
+def wait_ecs_tasks_batch(ecs_client, ecs_cluster_name, task_arns):
+    active_arns = set(task_arns)
     attempts = 0
-    failures = 0
-    print(f'Waiting on task_arn={task_arn}', flush=True)
-    client = boto3.client('ecs')
+    failures = {}
+    deadline = time.time() + MAX_WAITER_ATTEMPTS * WAITER_SLEEP
+    print(f'Waiting on task_arns={task_arns}', flush=True)
 
-    while running:
+    while active_arns:
         if attempts > 0:
-            __sleep(WAITER_SLEEP, "Waiting to poll for task status, taskarn={}".format(task_arn))
+            delay = min(WAITER_SLEEP, INITIAL_WAITER_SLEEP * (WAITER_BACKOFF_MULTIPLIER ** min(attempts - 1, 6)))
+            __sleep(int(delay), "Waiting to poll for task status, taskarns={}".format(sorted(active_arns)))
         attempts += 1
-        response = client.describe_tasks(
+        response = ecs_client.describe_tasks(
                 cluster=ecs_cluster_name,
-                tasks=[
-                    task_arn,
-                ]
+                tasks=[arn for arn in task_arns if arn in active_arns]
             )
         print(f'describe_task_wait_on={response}', flush=True)
-        if len(response['failures']) > 0:
+        for failure in response['failures']:
             # above we print the full actual reponse for debugging
-            print('decribe_task failure', flush=True)
-            failures += 1
-            if failures >= MAX_WAITER_DESCRIBE_FAILURES:
-                break
-            continue
-        status = response['tasks'][0]['lastStatus']
-        print(f'task {task_arn} is {status}', flush=True)
-        # https://docs.aws.amazon.com/AmazonECS/latest/developerguide/task-lifecycle.html
-        if status == 'STOPPED' or status == 'DELETED':
-            running = False
-        if attempts >= MAX_WAITER_ATTEMPTS:
-            print(f'stopped tasks waiter failed after {MAX_WAITER_ATTEMPTS}', flush=True)
-            running = False
-
+            print(f'decribe_task failure for task {failure["arn"]}', flush=True)
+            failures[failure['arn']] = failures.get(failure['arn'], 0) + 1
+            if failures[failure['arn']] >= MAX_WAITER_DESCRIBE_FAILURES:
+                active_arns.discard(failure['arn'])
+        for task in response['tasks']:
+            status = task['lastStatus']
+            print(f'task {task["taskArn"]} is {status}', flush=True)
+            # https://docs.aws.amazon.com/AmazonECS/latest/developerguide/task-lifecycle.html
+            if status == 'STOPPED' or status == 'DELETED':
+                active_arns.discard(task['taskArn'])
+        if active_arns and time.time() >= deadline:
+            print(f'stopped tasks waiter failed after {attempts} attempts', flush=True)
+            break
+
+# Compile the validator once so each validation does not pay for `go run`
+def build_validator():
+    subprocess.run(['go', 'build', '-o', VALIDATOR_BINARY_PATH, './load_tests/validation/validate.go'], check=True)
+
+# Run a single validator process and return (return_code, stdout, stderr)
+# Output is redirected to temporary files rather than pipes so that a chatty
+# validator never blocks on a full pipe buffer
+def run_validator(exec_args, env=None):
+    print("Running validator process. cmd=[{}]".format(' '.join(exec_args)), flush=True)
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(exec_args, stdout=stdout_file, stderr=stderr_file, env=env)
+        try:
+            process.wait(timeout=VALIDATOR_TIMEOUT_IN_SECOND)
+        except subprocess.TimeoutExpired:
+            print("Validator process timed out after {}s cmd=[{}]".format(VALIDATOR_TIMEOUT_IN_SECOND, ' '.join(exec_args)), flush=True)
+            process.kill()
+            process.wait()
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        return process.returncode, stdout_file.read(), stderr_file.read()
 
 # For tests on ECS, we need to:
 #  1. generate and register task definitions based on templates at /load_tests/task_definitons
@@ -241,20 +297,23 @@ def wait_ecs_tasks(ecs_cluster_name, task_arn):
 def run_ecs_tests():
     ecs_cluster_name = os.environ['ECS_CLUSTER_NAME']
     names = {}
+    ecs_client = boto3.client('ecs', config=BOTO_CLIENT_CONFIG)
+    s3_client = boto3.client('s3', config=BOTO_CLIENT_CONFIG)
+    build_validator()
+
+    # S3 Fluent Bit extra config data, uploaded for all input loggers at once
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(INPUT_LOGGERS)) as executor:
+        s3_fluent_config_arns = list(executor.map(lambda input_logger: publish_fluent_config_s3(s3_client, input_logger), INPUT_LOGGERS))
 
     # Run ecs tests once per input logger type
     test_results = []
-    for input_logger in INPUT_LOGGERS:
-        client = boto3.client('ecs')
-
-        # S3 Fluent Bit extra config data
-        s3_fluent_config_arn = publish_fluent_config_s3(input_logger)
-
+    for input_logger, s3_fluent_config_arn in zip(INPUT_LOGGERS, s3_fluent_config_arns):
         # Run ecs tasks and store task arns
-        for throughput in THROUGHPUT_LIST:
-            os.environ['THROUGHPUT'] = throughput
-            generate_task_definition(throughput, input_logger, s3_fluent_config_arn)
-            response = client.run_task(
+        for i, throughput in enumerate(THROUGHPUT_LIST):
+            # Task definitions only differ by throughput, so print the first one per input logger
+            is_printed = IS_TASK_DEFINITION_PRINTED and i == 0
+            generate_task_definition(ecs_client, throughput, input_logger, s3_fluent_config_arn, is_printed)
+            response = ecs_client.run_task(
                     cluster=ecs_cluster_name,
                     launchType='EC2',
                     taskDefinition=f'{PREFIX}{OUTPUT_PLUGIN}-{throughput}-{input_logger["name"]}'
@@ -272,72 +331,74 @@ def run_ecs_tests():
     for input_logger in INPUT_LOGGERS:
         # Wait until task stops and start validation
         processes = []
-
-        for throughput in THROUGHPUT_LIST:
-            client = boto3.client('ecs')
-            task_arn = names[f'{OUTPUT_PLUGIN}_{input_logger["name"]}_{throughput}_task_arn']
-            wait_ecs_tasks(ecs_cluster_name, task_arn)
-            response = client.describe_tasks(
-                cluster=ecs_cluster_name,
-                tasks=[
-                    task_arn,
+        task_arns = [names[f'{OUTPUT_PLUGIN}_{input_logger["name"]}_{throughput}_task_arn'] for throughput in THROUGHPUT_LIST]
+        wait_ecs_tasks_batch(ecs_client, ecs_cluster_name, task_arns)
+        response = ecs_client.describe_tasks(
+            cluster=ecs_cluster_name,
+            tasks=task_arns
+        )
+        print(f'describe_tasks_response={response}', flush=True)
+        tasks_by_arn = {task['taskArn']: task for task in response['tasks']}
+        # Fail fast before any validator is started, otherwise exiting from inside
+        # the executor would first wait for every submitted validation to finish
+        for task in tasks_by_arn.values():
+            check_app_exit_code(task)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(THROUGHPUT_LIST), MAX_VALIDATOR_WORKERS)) as executor:
+            for throughput, task_arn in zip(THROUGHPUT_LIST, task_arns):
+                print(f'task_arn={task_arn}', flush=True)
+                task = tasks_by_arn.get(task_arn)
+                input_record = calculate_total_input_number(throughput)
+                if task is not None:
+                    start_epoch_time = parse_time(task['startedAt'])
+                    stop_epoch_time = parse_time(task['stoppedAt'])
+                    log_delay = get_log_delay(stop_epoch_time-start_epoch_time-LOGGER_RUN_TIME_IN_SECOND)
+                    set_buffer(stop_epoch_time)
+                else:
+                    # missing tasks might mean the task stopped some time ago
+                    # and ECS already reaped/deleted it
+                    # try skipping straight to validation
+                    log_delay = 'unavailable' # we don't actually use this right now in results
+
+                # Validate logs
+                validator_env = {
+                    **os.environ,
+                    'LOG_SOURCE_NAME': input_logger["name"],
+                    'LOG_SOURCE_IMAGE': input_logger["logger_image"],
+                }
+                validated_input_prefix = get_validated_input_prefix(input_logger)
+                input_configuration = get_input_configuration(validated_input_prefix, throughput)
+                test_configuration = {
+                    "input_configuration": input_configuration,
+                }
+
+                if OUTPUT_PLUGIN == 'cloudwatch':
+                    log_prefix = resource_resolver.get_destination_cloudwatch_prefix(test_configuration["input_configuration"])
+                else:
+                    log_prefix = resource_resolver.get_destination_s3_prefix(test_configuration["input_configuration"], OUTPUT_PLUGIN)
+
+                exec_args = [VALIDATOR_BINARY_PATH,
+                    '-input-record', input_record,
+                    '-log-delay', log_delay,
+                    '-region', AWS_REGION,
+                    '-bucket', S3_BUCKET_NAME,
+                    '-log-group', LOG_GROUP_NAME,
+                    '-prefix', log_prefix,
+                    '-destination', OUTPUT_PLUGIN,
                 ]
-            )
-            print(f'task_arn={task_arn}', flush=True)
-            print(f'describe_tasks_response={response}', flush=True)
-            input_record = calculate_total_input_number(throughput)
-            if len(response['failures']) == 0:
-                check_app_exit_code(response)
-                start_time = response['tasks'][0]['startedAt']
-                stop_time = response['tasks'][0]['stoppedAt']
-                log_delay = get_log_delay(parse_time(stop_time)-parse_time(start_time)-LOGGER_RUN_TIME_IN_SECOND)
-                set_buffer(parse_time(stop_time))
-            else:
-                # missing tasks might mean the task stopped some time ago
-                # and ECS already reaped/deleted it
-                # try skipping straight to validation
-                log_delay = 'unavailable' # we don't actually use this right now in results
-
-            # Validate logs
-            os.environ['LOG_SOURCE_NAME'] = input_logger["name"]
-            os.environ['LOG_SOURCE_IMAGE'] = input_logger["logger_image"]
-            validated_input_prefix = get_validated_input_prefix(input_logger)
-            input_configuration = resource_resolver.get_input_configuration(PLATFORM, validated_input_prefix, throughput)
-            test_configuration = {
-                "input_configuration": input_configuration,
-            }
-
-            if OUTPUT_PLUGIN == 'cloudwatch':
-                log_prefix = resource_resolver.get_destination_cloudwatch_prefix(test_configuration["input_configuration"])
-            else:
-                log_prefix = resource_resolver.get_destination_s3_prefix(test_configuration["input_configuration"], OUTPUT_PLUGIN)
-
-            exec_args = ['go', 'run', './load_tests/validation/validate.go',
-                '-input-record', input_record,
-                '-log-delay', log_delay,
-                '-region', AWS_REGION,
-                '-bucket', S3_BUCKET_NAME,
-                '-log-group', LOG_GROUP_NAME,
-                '-prefix', log_prefix,
-                '-destination', OUTPUT_PLUGIN,
-            ]
-            print("Running validator process. cmd=[{}]".format(' '.join(exec_args)), flush=True)
-            processes.append({
-                "input_logger": input_logger,
-                "test_configuration": test_configuration,
-                "process": subprocess.Popen(exec_args, stdout=subprocess.PIPE)
-            })
-
-        # Wait until all subprocesses for validation completed
-        for p in processes:
-            print("Waiting for validator process to complete cmd=[{}]".format(' '.join(p["process"].args)), flush=True)
-            p["process"].wait()
-            stdout, stderr = p["process"].communicate()
-            return_code = p["process"].returncode
-            print(f'{input_logger["name"]} to {OUTPUT_PLUGIN} raw validator stdout: {stdout}', flush=True)
-            print(f'{input_logger["name"]} to {OUTPUT_PLUGIN} raw validator stderr: {stderr}', flush=True)
-            print(f'{input_logger["name"]} to {OUTPUT_PLUGIN} raw validator return code: {return_code}', flush=True)
-            p["result"] = stdout
+                processes.append({
+                    "input_logger": input_logger,
+                    "test_configuration": test_configuration,
+                    "validator": executor.submit(run_validator, exec_args, validator_env)
+                })
+
+            # Wait until all subprocesses for validation completed
+            for p in processes:
+                return_code, stdout, stderr = p["validator"].result()
+                print(f'{input_logger["name"]} to {OUTPUT_PLUGIN} raw validator stdout: {stdout}', flush=True)
+                print(f'{input_logger["name"]} to {OUTPUT_PLUGIN} raw validator stderr: {stderr}', flush=True)
+                print(f'{input_logger["name"]} to {OUTPUT_PLUGIN} raw validator return code: {return_code}', flush=True)
+                p["result"] = stdout
         print(f'Test {input_logger["name"]} to {OUTPUT_PLUGIN} complete.', flush=True)
 
         parsedValidationOutputs = list(map(lambda p: {
@@ -359,25 +420,22 @@ def run_ecs_tests():
         print("Passed validation bar.", flush=True)
 
 def parse_validation_output(validationResultString):
-    return { x[0]: x[1] for x in list(
-        filter(lambda f: len(f) == 2,
-            map(lambda x: x.split(",  "), validationResultString.decode("utf-8").split("\n"))
-        ))}
+    return dict(parts for line in validationResultString.decode("utf-8").splitlines() if len(parts := line.split(",  ")) == 2)
 
-def get_validation_output(logger_name, throughput, test_results):
-    return list(filter(lambda r: r["input_logger"]["name"] == logger_name and
-            int(r["test_configuration"]["input_configuration"]["throughput"].replace("m", "")) == throughput, test_results))[0]["parsed_validation_output"]
+def get_throughput_in_mb(test_result):
+    return int(test_result["test_configuration"]["input_configuration"]["throughput"].replace("m", ""))
 
 def format_test_results_to_markdown(test_results):
     # Configurable success character
     no_problem_cell_character = u"\U00002705" # This is a green check mark
 
+    # Index validation outputs by (logger name, throughput) for constant time cell lookups
+    validation_outputs = {(r["input_logger"]["name"], get_throughput_in_mb(r)): r["parsed_validation_output"] for r in test_results}
+
     # Get table dimensions
-    logger_names = list(set(map(lambda p: p["input_logger"]["name"], test_results)))
-    logger_names.sort()
+    logger_names = sorted(set(name for name, _ in validation_outputs))
     plugin_name = PLUGIN_NAME_MAPS[OUTPUT_PLUGIN]
-    throughputs = list(set(map(lambda p: int(p["test_configuration"]["input_configuration"]["throughput"].replace("m", "")), test_results)))
-    throughputs.sort()
+    throughputs = sorted(set(throughput for _, throughput in validation_outputs))
 
     # | plugin                   | source               |                            | 10 MB/s       | 20 MB/s       | 30 MB/s       |\n"
     # |--------------------------|----------------------|----------------------------|---------------|---------------|---------------|\n"
@@ -386,71 +444,77 @@ def format_test_results_to_markdown(test_results):
     col3_len = len("                            ")
     colX_len = len(" 10 MB/s       ")
 
-    output  = f'|{" plugin".ljust(col1_len)}|{" source".ljust(col2_len)}|{"".ljust(col3_len)}|'
+    parts = [f'|{" plugin".ljust(col1_len)}|{" source".ljust(col2_len)}|{"".ljust(col3_len)}|']
     for throughput in throughputs:
-        output += (" " + str(throughput) + " MB/s").ljust(colX_len) + "|"
-    output += f"\n|{'-'*col1_len}|{'-'*col2_len}|{'-'*col3_len}|"
+        parts.append((" " + str(throughput) + " MB/s").ljust(colX_len) + "|")
+    parts.append(f"\n|{'-'*col1_len}|{'-'*col2_len}|{'-'*col3_len}|")
     for throughput in throughputs:
-        output += f"{'-'*colX_len}|"
-    output += "\n"
+        parts.append(f"{'-'*colX_len}|")
+    parts.append("\n")
 
     # | kinesis_firehose          |  stdout             | Log Loss                   |               |               |               |\n"
     for logger_name in logger_names:
-        output += "|"
-        output += (" " + plugin_name).ljust(col1_len) + "|"
-        output += (" " + logger_name).ljust(col2_len) + "|"
-        output += (" Log Loss").ljust(col3_len) + "|"
+        parts.append("|")
+        parts.append((" " + plugin_name).ljust(col1_len) + "|")
+        parts.append((" " + logger_name).ljust(col2_len) + "|")
+        parts.append((" Log Loss").ljust(col3_len) + "|")
 
         for throughput in throughputs:
-            validation_output = get_validation_output(logger_name, throughput, test_results)
+            validation_output = validation_outputs[(logger_name, throughput)]
 
             if (int(validation_output["missing"]) != 0):
-                output += (str(validation_output["percent_loss"]) + "%(" + str(validation_output["missing"]) + ")").ljust(colX_len)
+                parts.append((str(validation_output["percent_loss"]) + "%(" + str(validation_output["missing"]) + ")").ljust(colX_len))
             else:
-                output += (" " + no_problem_cell_character).ljust(colX_len)
+                parts.append((" " + no_problem_cell_character).ljust(colX_len))
 
-            output += "|"
-        output += "\n"
+            parts.append("|")
+        parts.append("\n")
 
-        output += "|"
-        output += (" ").ljust(col1_len) + "|"
-        output += (" ").ljust(col2_len) + "|"
-        output += (" Log Duplication").ljust(col3_len) + "|"
+        parts.append("|")
+        parts.append((" ").ljust(col1_len) + "|")
+        parts.append((" ").ljust(col2_len) + "|")
+        parts.append((" Log Duplication").ljust(col3_len) + "|")
 
         for throughput in throughputs:
-            validation_output = get_validation_output(logger_name, throughput, test_results)
+            validation_output = validation_outputs[(logger_name, throughput)]
 
             duplication_percent = (0 if int(validation_output["duplicate"]) == 0
                 else math.floor(int(validation_output["duplicate"]) / int(validation_output["total_destination"]) * 100))
 
             if (int(validation_output["duplicate"]) != 0):
-                output += (str(duplication_percent) + "%(" + str(validation_output["duplicate"]) + ")").ljust(colX_len)
+                parts.append((str(duplication_percent) + "%(" + str(validation_output["duplicate"]) + ")").ljust(colX_len))
             else:
-                output += (" " + no_problem_cell_character).ljust(colX_len)
+                parts.append((" " + no_problem_cell_character).ljust(colX_len))
 
-            output += "|"
-        output += "\n"
-    return output
+            parts.append("|")
+        parts.append("\n")
+    return ''.join(parts)
 
-def parse_json_template(template, dict):
-    data = template
-    for key in dict:
-            if(key[0] == '$'):
-                data = data.replace(key, dict[key])
-            else:
-                for sub_key in dict[key]:
-                    data = data.replace(sub_key, dict[key][sub_key])
-    return data
+# Compile one alternation of all placeholders, longest first so that a
+# placeholder is never shadowed by another one that is its prefix
+@lru_cache(maxsize=None)
+def get_template_pattern(keys):
+    return re.compile('|'.join(map(re.escape, sorted(keys, key=len, reverse=True))))
+
+# Substitute every placeholder in a single pass over the template
+def parse_json_template(template, placeholders):
+    if not placeholders:
+        return template
+    pattern = get_template_pattern(frozenset(placeholders))
+    return pattern.sub(lambda m: placeholders[m.group(0)], template)
 
 # Returns s3 arn
-def publish_fluent_config_s3(input_logger):
-    s3 = boto3.client('s3')
-    s3.upload_file(
-        input_logger["fluent_config_file_path"],
-        S3_BUCKET_NAME,
-        f'{OUTPUT_PLUGIN}-test/{PLATFORM}/fluent-{input_logger["name"]}.conf',
-    )
-    return f'arn:aws:s3:::{S3_BUCKET_NAME}/{OUTPUT_PLUGIN}-test/{PLATFORM}/fluent-{input_logger["name"]}.conf'
+# Config files are only a few KB, so a single put_object avoids spinning up
+# the multipart transfer manager for every upload
+def publish_fluent_config_s3(s3_client, input_logger):
+    key = f'{OUTPUT_PLUGIN}-test/{PLATFORM}/fluent-{input_logger["name"]}.conf'
+    with open(input_logger["fluent_config_file_path"], 'rb') as f:
+        s3_client.put_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=key,
+            Body=f.read()
+        )
+    return f'arn:aws:s3:::{S3_BUCKET_NAME}/{key}'
 
 # The following method is used to clear data after all tests run.
 # We set retention/expiration policies so that tests do not interfere with each other, and so that
@@ -459,7 +523,7 @@ def delete_testing_data(session):
     print("Setting auto-delete policies for CW log groups, deleting S3 bucket")
     retention_days = 5
 
-    logs_client = session.client('logs')
+    logs_client = session.client('logs', config=BOTO_CLIENT_CONFIG)
     try:
         # Set the retention policy for the log group
         response = logs_client.put_retention_policy(
@@ -473,10 +537,22 @@ def delete_testing_data(session):
     # Empty s3 bucket
     # lifecycle config cannot currently be used because the bucket name
     # is reused between tests, so it must be completely deleted after each test.
-    s3 = session.resource('s3')
-    bucket = s3.Bucket(S3_BUCKET_NAME)
+    s3_client = session.client('s3', config=BOTO_CLIENT_CONFIG)
+    paginator = s3_client.get_paginator('list_objects_v2')
     print(f"Deleting all objects in s3 bucket: {S3_BUCKET_NAME}")
-    bucket.objects.all().delete()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_S3_DELETE_WORKERS) as executor:
+        futures = []
+        for page in paginator.paginate(Bucket=S3_BUCKET_NAME):
+            # A page holds at most 1000 keys, which is also the delete_objects limit
+            objects = [{'Key': o['Key']} for o in page.get('Contents', [])]
+            if objects:
+                futures.append(executor.submit(s3_client.delete_objects,
+                    Bucket=S3_BUCKET_NAME,
+                    Delete={'Objects': objects, 'Quiet': True}
+                ))
+        for future in concurrent.futures.as_completed(futures):
+            for error in future.result().get('Errors', []):
+                print(f"Error deleting object: {error}")
 
 def generate_daemonset_config(throughput):
     daemonset_config_dict = {
@@ -486,39 +562,73 @@ def generate_daemonset_config(throughput):
         '$TIME': str(LOGGER_RUN_TIME_IN_SECOND),
         '$CW_LOG_GROUP_NAME': LOG_GROUP_NAME,
     }
-    fin = open(f'./load_tests/daemonset/{OUTPUT_PLUGIN}.yaml', 'r')
-    data = fin.read()
+    data = read_template(f'./load_tests/daemonset/{OUTPUT_PLUGIN}.yaml')
     for key in daemonset_config_dict:
         data = data.replace(key, daemonset_config_dict[key])
-    fout = open(f'./load_tests/daemonset/{OUTPUT_PLUGIN}_{throughput}.yaml', 'w')
-    fout.write(data)
-    fout.close()
-    fin.close()
+    with open(f'./load_tests/daemonset/{OUTPUT_PLUGIN}_{throughput}.yaml', 'w') as fout:
+        fout.write(data)
+
+# Return every app log stream of the throughput's daemonset, across all result pages
+def describe_app_log_streams(logs_client, throughput):
+    paginator = logs_client.get_paginator('describe_log_streams')
+    pages = paginator.paginate(
+        logGroupName=LOG_GROUP_NAME,
+        logStreamNamePrefix=f'{PREFIX}kube.var.log.containers.ds-cloudwatch-{throughput}',
+        orderBy='LogStreamName'
+    )
+    return [log_stream for log_stream in chain.from_iterable(page['logStreams'] for page in pages)
+        if 'app-' in log_stream['logStreamName']]
+
+# Wait for the loggers to run, then poll until every throughput has at least one app log stream
+# and no stream ingested new events for EKS_LOG_DELIVERY_QUIET_PERIOD_IN_SECOND,
+# or the delivery timeout is reached
+def wait_eks_log_streams(logs_client):
+    start_time = time.time()
+    __sleep(LOGGER_RUN_TIME_IN_SECOND, "Waiting 10 minutes for loggers to run")
+    previous_ingestion_times = None
+    quiet_since = None
+    while True:
+        app_log_streams = {throughput: describe_app_log_streams(logs_client, throughput) for throughput in THROUGHPUT_LIST}
+        ingestion_times = {log_stream['logStreamName']: log_stream.get('lastIngestionTime')
+            for log_streams in app_log_streams.values() for log_stream in log_streams}
+        if (not all(app_log_streams.values())
+                or ingestion_times != previous_ingestion_times):
+            quiet_since = time.time()
+        elif time.time() - quiet_since >= EKS_LOG_DELIVERY_QUIET_PERIOD_IN_SECOND:
+            return app_log_streams
+        if time.time() - start_time >= EKS_LOG_DELIVERY_TIMEOUT_IN_SECOND:
+            print(f'log streams not settled after {EKS_LOG_DELIVERY_TIMEOUT_IN_SECOND}s, validating what is available', flush=True)
+            return app_log_streams
+        previous_ingestion_times = ingestion_times
+        __sleep(EKS_LOG_STREAM_WAITER_SLEEP, "Waiting for log delivery to complete")
 
 def run_eks_tests():
-    client = boto3.client('logs')
-    processes = set()
-
-    for throughput in THROUGHPUT_LIST:
-        generate_daemonset_config(throughput)
-        os.system(f'kubectl apply -f ./load_tests/daemonset/{OUTPUT_PLUGIN}_{throughput}.yaml')
-    # wait (10 mins run + buffer for setup/log delivery)
-    __sleep(1000, "Waiting 10 minutes+buffer to setup and log delivery")
+    logs_client = boto3.client('logs', config=BOTO_CLIENT_CONFIG)
+    build_validator()
+
+    # Generate and apply the daemonset for every throughput concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(THROUGHPUT_LIST)) as executor:
+        list(executor.map(generate_daemonset_config, THROUGHPUT_LIST))
+    apply_processes = [subprocess.Popen(['kubectl', 'apply', '-f', f'./load_tests/daemonset/{OUTPUT_PLUGIN}_{throughput}.yaml'])
+        for throughput in THROUGHPUT_LIST]
+    for p in apply_processes:
+        if p.wait() != 0:
+            sys.exit('[TEST_FAILURE] Failed to apply daemonset. cmd=[{}] return code: {}'.format(' '.join(p.args), p.returncode))
+    app_log_streams = wait_eks_log_streams(logs_client)
+    validations = []
     for throughput in THROUGHPUT_LIST:
         input_record = calculate_total_input_number(throughput)
-        response = client.describe_log_streams(
-            logGroupName=LOG_GROUP_NAME,
-            logStreamNamePrefix=f'{PREFIX}kube.var.log.containers.ds-cloudwatch-{throughput}',
-            orderBy='LogStreamName'
-        )
-        for log_stream in response['logStreams']:
-            if 'app-' not in log_stream['logStreamName']:
+        for log_stream in app_log_streams[throughput]:
+            expect_time = log_stream.get('lastEventTimestamp')
+            actual_time = log_stream.get('lastIngestionTime')
+            if expect_time is None or actual_time is None:
+                # the stream was created but has not received any events yet
+                print(f'skipping log stream without events. logStreamName={log_stream["logStreamName"]}', flush=True)
                 continue
-            expect_time = log_stream['lastEventTimestamp']
-            actual_time = log_stream['lastIngestionTime']
             log_delay = get_log_delay(actual_time/1000-expect_time/1000)
-            log_prefix = resource_resolver.get_destination_cloudwatch_prefix(test_configuration["input_configuration"])
-            exec_args = ['go', 'run', './load_tests/validation/validate.go',
+            # Every app container writes to its own log stream, which is what the validator reads
+            log_prefix = log_stream['logStreamName']
+            exec_args = [VALIDATOR_BINARY_PATH,
                          '-input-record', input_record,
                          '-log-delay', log_delay,
                          '-region', AWS_REGION,
@@ -526,11 +636,18 @@ def run_eks_tests():
                          '-log-group', LOG_GROUP_NAME,
                          '-prefix', log_prefix,
                          '-destination', OUTPUT_PLUGIN]
-            processes.add(subprocess.Popen(exec_args))
+            validations.append({
+                "log_stream_name": log_stream['logStreamName'],
+                "exec_args": exec_args,
+            })
 
     # Wait until all subprocesses for validation completed
-    for p in processes:
-        p.wait()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(validations), MAX_VALIDATOR_WORKERS) or 1) as executor:
+        results = list(executor.map(run_validator, [v["exec_args"] for v in validations]))
+    for v, (return_code, stdout, stderr) in zip(validations, results):
+        print(f'{v["log_stream_name"]} to {OUTPUT_PLUGIN} raw validator stdout: {stdout}', flush=True)
+        print(f'{v["log_stream_name"]} to {OUTPUT_PLUGIN} raw validator stderr: {stderr}', flush=True)
+        print(f'{v["log_stream_name"]} to {OUTPUT_PLUGIN} raw validator return code: {return_code}', flush=True)
 
 def delete_testing_resources():
     print("Deleting test resources")
@@ -543,15 +660,18 @@ def delete_testing_resources():
 
     print(f"Deleting cloudformation stack. stackName={TESTING_RESOURCES_STACK_NAME}", flush=True)
     # All related testing resources will be destroyed once the stack is deleted
-    client = session.client('cloudformation')
+    client = session.client('cloudformation', config=BOTO_CLIENT_CONFIG)
     client.delete_stack(
         StackName=TESTING_RESOURCES_STACK_NAME
     )
     # scale down eks cluster
     if PLATFORM == 'eks':
         print("Scaling down EKS cluster", flush=True)
-        os.system('kubectl delete namespace load-test-fluent-bit-eks-ns')
-        os.system(f'eksctl scale nodegroup --cluster={EKS_CLUSTER_NAME} --nodes=0 ng')
+        # a missing namespace should not stop the cluster from being scaled down
+        result = subprocess.run(['kubectl', 'delete', 'namespace', 'load-test-fluent-bit-eks-ns'])
+        if result.returncode != 0:
+            print(f"Failed to delete namespace, return code: {result.returncode}", flush=True)
+        subprocess.run(['eksctl', 'scale', 'nodegroup', f'--cluster={EKS_CLUSTER_NAME}', '--nodes=0', 'ng'], check=True)
 
 def get_validated_input_prefix(input_logger):
     # Prefix used to form destination identifier
@@ -566,7 +686,7 @@ def get_validated_input_prefix(input_logger):
 
 def get_sts_boto_session():
     # STS credentials
-    sts_client = boto3.client('sts')
+    sts_client = boto3.client('sts', config=BOTO_CLIENT_CONFIG)
 
     # Call the assume_role method of the STSConnection object and pass the role
     # ARN and a role session name.